@@ -2,6 +2,13 @@
 
 from . import ws
 from .models import Stream, WebRTCSdpAnswer, WebRTCSdpOffer
-from .rest import Go2RtcRestClient
+from .rest import Go2RtcRestClient, make_default_session
 
-__all__ = ["Go2RtcRestClient", "Stream", "WebRTCSdpAnswer", "WebRTCSdpOffer", "ws"]
+__all__ = [
+    "Go2RtcRestClient",
+    "Stream",
+    "WebRTCSdpAnswer",
+    "WebRTCSdpOffer",
+    "make_default_session",
+    "ws",
+]
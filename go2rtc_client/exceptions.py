@@ -18,6 +18,16 @@ from mashumaro.exceptions import (
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
 
+_WRAPPED_ERRORS = (
+    ClientError,
+    ExtraKeysError,
+    InvalidFieldValue,
+    MissingDiscriminatorError,
+    MissingField,
+    SuitableVariantNotFoundError,
+    UnserializableDataError,
+)
+
 
 class Go2RtcClientError(Exception):
     """Base exception for go2rtc client."""
@@ -54,15 +64,7 @@ def handle_error[**_P, _R](
     async def _func(*args: _P.args, **kwargs: _P.kwargs) -> _R:
         try:
             return await func(*args, **kwargs)
-        except (
-            ClientError,
-            ExtraKeysError,
-            InvalidFieldValue,
-            MissingDiscriminatorError,
-            MissingField,
-            SuitableVariantNotFoundError,
-            UnserializableDataError,
-        ) as exc:
+        except _WRAPPED_ERRORS as exc:
             raise Go2RtcClientError from exc
 
     return _func
@@ -3,42 +3,31 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import Any, Final, Literal
 
-from awesomeversion import AwesomeVersion
-from mashumaro import field_options
+from mashumaro.codecs.basic import BasicDecoder
 from mashumaro.mixins.orjson import DataClassORJSONMixin
-from mashumaro.types import SerializationStrategy
+import orjson
 
 
-class _AwesomeVersionSerializer(SerializationStrategy):
-    def serialize(self, value: AwesomeVersion) -> str:
-        return str(value)
-
-    def deserialize(self, value: str) -> AwesomeVersion:
-        return AwesomeVersion(value)
-
-
-@dataclass
+@dataclass(slots=True)
 class ApplicationInfo(DataClassORJSONMixin):
     """Application info model.
 
     Currently only the server version is exposed.
     """
 
-    version: AwesomeVersion = field(
-        metadata=field_options(serialization_strategy=_AwesomeVersionSerializer())
-    )
+    version: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Streams(DataClassORJSONMixin):
     """Streams model."""
 
     streams: dict[str, Stream]
 
 
-@dataclass
+@dataclass(slots=True)
 class Stream:
     """Stream model."""
 
@@ -47,36 +36,87 @@ class Stream:
     @classmethod
     def __pre_deserialize__(cls, d: dict[Any, Any]) -> dict[Any, Any]:
         """Pre deserialize."""
-        # Ensure producers is always a list
-        if "producers" in d and d["producers"] is None:
+        # Ensure producers is always a list, same as _decode_stream
+        if "producers" not in d or d["producers"] is None:
             d["producers"] = []
 
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class Producer:
     """Producer model."""
 
     url: str
 
 
-@dataclass
+_STREAMS_DECODER: Final = BasicDecoder(dict[str, Stream])
+
+
+def _decode_stream(d: Any) -> Stream | None:
+    """Decode a stream without going through mashumaro.
+
+    Return None for anything but the expected types,
+    so the caller can leave the coercion and the errors to mashumaro.
+    """
+    if type(d) is not dict:
+        return None
+    if (raw_producers := d.get("producers")) is None:
+        raw_producers = []
+    elif type(raw_producers) is not list:
+        return None
+    producers = []
+    for raw_producer in raw_producers:
+        if (
+            type(raw_producer) is not dict
+            or type(url := raw_producer.get("url")) is not str
+        ):
+            return None
+        producer = object.__new__(Producer)
+        producer.url = url
+        producers.append(producer)
+    obj = object.__new__(Stream)
+    obj.producers = producers
+    return obj
+
+
+def _decode_streams(d: Any) -> dict[str, Stream]:
+    """Decode the streams response without going through mashumaro."""
+    if type(d) is dict:
+        streams = {}
+        for name, raw_stream in d.items():
+            if (stream := _decode_stream(raw_stream)) is None:
+                break
+            streams[name] = stream
+        else:
+            return streams
+    # Leave the coercion and the errors to mashumaro
+    return _STREAMS_DECODER.decode(d)
+
+
+@dataclass(slots=True)
 class WebRTCSdp(DataClassORJSONMixin):
     """WebRTC SDP model."""
 
     type: Literal["offer", "answer"]
     sdp: str
 
+    def to_json(self, *args: Any, **kwargs: Any) -> str:
+        """Convert to json."""
+        if args or kwargs:
+            # super() does not work in slotted dataclasses
+            return DataClassORJSONMixin.to_json(self, *args, **kwargs)
+        return orjson.dumps({"type": self.type, "sdp": self.sdp}).decode()
+
 
-@dataclass
+@dataclass(slots=True)
 class WebRTCSdpOffer(WebRTCSdp):
     """WebRTC SDP offer model."""
 
     type: Literal["offer"] = field(default="offer", init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class WebRTCSdpAnswer(WebRTCSdp):
     """WebRTC SDP answer model."""
 
@@ -2,34 +2,97 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
 import logging
+import re
 from typing import TYPE_CHECKING, Any, Final, Literal
 
-from aiohttp import ClientError, ClientResponse, ClientSession, ClientTimeout
-from aiohttp.client import _RequestOptions
+from aiohttp import (
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    ContentTypeError,
+    TCPConnector,
+    hdrs,
+)
 from awesomeversion import AwesomeVersion, AwesomeVersionException
-from mashumaro.codecs.basic import BasicDecoder
-from mashumaro.mixins.dict import DataClassDictMixin
+import orjson
 from yarl import URL
 
 from .exceptions import Go2RtcVersionError, handle_error
-from .models import ApplicationInfo, Stream, WebRTCSdpAnswer, WebRTCSdpOffer
+from .models import (
+    ApplicationInfo,
+    Stream,
+    WebRTCSdpAnswer,
+    WebRTCSdpOffer,
+    _decode_streams,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from aiohttp.client import _RequestOptions
+
 _LOGGER = logging.getLogger(__name__)
 
 _API_PREFIX = "/api"
 _MIN_VERSION_SUPPORTED: Final = AwesomeVersion("1.9.4")
 _MIN_VERSION_UNSUPPORTED: Final = AwesomeVersion("2.0.0")
+_MIN_VERSION_SUPPORTED_TUPLE: Final = (1, 9, 4)
+_MIN_VERSION_UNSUPPORTED_TUPLE: Final = (2, 0, 0)
+_SEMVER_PATTERN: Final = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+_DEFAULT_TIMEOUT: Final = ClientTimeout(total=10)
+_JSON_HEADERS: Final = {hdrs.CONTENT_TYPE: "application/json"}
+# Same pattern as ClientResponse.json, accepts types like application/problem+json
+_JSON_CONTENT_TYPE_PATTERN: Final = re.compile(r"^application/(?:[\w.+-]+?\+)?json")
 
 
-@lru_cache(maxsize=2)
-def _version_is_supported(version: AwesomeVersion) -> bool:
+def _version_is_supported(version: str) -> bool:
     """Check if the server version is supported."""
-    return _MIN_VERSION_SUPPORTED <= version < _MIN_VERSION_UNSUPPORTED
+    if match := _SEMVER_PATTERN.fullmatch(version):
+        version_tuple = tuple(map(int, match.groups()))
+        return (
+            _MIN_VERSION_SUPPORTED_TUPLE
+            <= version_tuple
+            < _MIN_VERSION_UNSUPPORTED_TUPLE
+        )
+    # Pre-releases and other formats need the full AwesomeVersion comparison
+    return _MIN_VERSION_SUPPORTED <= AwesomeVersion(version) < _MIN_VERSION_UNSUPPORTED
+
+
+def _json_dumps(obj: Any) -> str:
+    """Encode JSON with orjson for aiohttp."""
+    return orjson.dumps(obj).decode()
+
+
+def make_default_session() -> ClientSession:
+    """Create a client session suited for a go2rtc server.
+
+    Connections are kept alive between requests and bodies are encoded with orjson.
+    Must be called from a running event loop and closed by the caller.
+    """
+    return ClientSession(
+        connector=TCPConnector(keepalive_timeout=75),
+        json_serialize=_json_dumps,
+        timeout=_DEFAULT_TIMEOUT,
+    )
+
+
+async def _read_json(resp: ClientResponse) -> Any:
+    """Read and decode the JSON body of a response."""
+    # Read first, like ClientResponse.json, so the connection is released
+    body = await resp.read()
+    content_type = resp.headers.get(hdrs.CONTENT_TYPE, "").lower()
+    if not _JSON_CONTENT_TYPE_PATTERN.match(content_type):
+        msg = f"Attempt to decode JSON with unexpected mimetype: {content_type}"
+        raise ContentTypeError(
+            resp.request_info,
+            resp.history,
+            status=resp.status,
+            message=msg,
+            headers=resp.headers,
+        )
+    return orjson.loads(body)
 
 
 class _BaseClient:
@@ -39,6 +102,14 @@ class _BaseClient:
         """Initialize Client."""
         self._session = websession
         self._base_url = URL(server_url)
+        self._urls: dict[str, URL] = {}
+
+    def _url(self, path: str) -> URL:
+        """Return the url for the given path."""
+        # Only a handful of paths are used, so build each url only once
+        if (url := self._urls.get(path)) is None:
+            url = self._urls[path] = self._base_url.with_path(path)
+        return url
 
     async def request(
         self,
@@ -46,17 +117,21 @@ class _BaseClient:
         path: str,
         *,
         params: Mapping[str, Any] | None = None,
-        data: DataClassDictMixin | dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
     ) -> ClientResponse:
-        """Make a request to the server."""
-        url = self._base_url.with_path(path)
+        """Make a request to the server.
+
+        Bytes are sent as already encoded JSON body.
+        """
+        url = self._url(path)
         _LOGGER.debug("request[%s] %s", method, url)
-        if isinstance(data, DataClassDictMixin):
-            data = data.to_dict()
-        kwargs = _RequestOptions(timeout=ClientTimeout(total=10))
+        kwargs: _RequestOptions = {"timeout": _DEFAULT_TIMEOUT}
         if params:
             kwargs["params"] = params
-        if data:
+        if isinstance(data, bytes):
+            kwargs["data"] = data
+            kwargs["headers"] = _JSON_HEADERS
+        elif data:
             kwargs["json"] = data
         try:
             resp = await self._session.request(method, url, **kwargs)
@@ -79,7 +154,7 @@ class _ApplicationClient:
     async def get_info(self) -> ApplicationInfo:
         """Get application info."""
         resp = await self._client.request("GET", self.PATH)
-        return ApplicationInfo.from_dict(await resp.json())
+        return ApplicationInfo.from_dict(await _read_json(resp))
 
 
 class _WebRTCClient:
@@ -99,9 +174,9 @@ class _WebRTCClient:
             "POST",
             self.PATH,
             params={src_or_dst: stream_name},
-            data=offer,
+            data=offer.to_json().encode(),
         )
-        return WebRTCSdpAnswer.from_dict(await resp.json())
+        return WebRTCSdpAnswer.from_dict(await _read_json(resp))
 
     @handle_error
     async def forward_whep_sdp_offer(
@@ -114,8 +189,19 @@ class _WebRTCClient:
             "src",
         )
 
+    @handle_error
+    async def forward_whep_sdp_offer_raw(self, source_name: str, offer: bytes) -> bytes:
+        """Forward an encoded WHEP SDP offer to the server.
 
-_GET_STREAMS_DECODER = BasicDecoder(dict[str, Stream])
+        The answer is returned as received, for callers only relaying it.
+        """
+        resp = await self._client.request(
+            "POST",
+            self.PATH,
+            params={"src": source_name},
+            data=offer,
+        )
+        return await resp.read()
 
 
 class _StreamClient:
@@ -138,7 +224,7 @@ class _StreamClient:
     async def list(self) -> dict[str, Stream]:
         """List streams registered with the server."""
         resp = await self._client.request("GET", self.PATH)
-        return _GET_STREAMS_DECODER.decode(await resp.json())
+        return _decode_streams(await _read_json(resp))
 
 
 class Go2RtcRestClient:
@@ -154,20 +240,20 @@ class Go2RtcRestClient:
     @handle_error
     async def validate_server_version(self) -> AwesomeVersion:
         """Validate the server version is compatible."""
-        application_info = await self.application.get_info()
+        version = (await self.application.get_info()).version
         try:
-            version_supported = _version_is_supported(application_info.version)
+            version_supported = _version_is_supported(version)
         except AwesomeVersionException as err:
             raise Go2RtcVersionError(
-                application_info.version if application_info else "unknown",
+                version,
                 _MIN_VERSION_SUPPORTED,
                 _MIN_VERSION_UNSUPPORTED,
             ) from err
         if not version_supported:
             raise Go2RtcVersionError(
-                application_info.version,
+                version,
                 _MIN_VERSION_SUPPORTED,
                 _MIN_VERSION_UNSUPPORTED,
             )
 
-        return application_info.version
+        return AwesomeVersion(version)
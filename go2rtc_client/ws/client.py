@@ -3,16 +3,18 @@
 import asyncio
 from collections.abc import Callable
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Final, get_args
 from urllib.parse import urljoin
 
-from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
+from aiohttp import ClientSession, ClientWebSocketResponse, WSMessage, WSMsgType
 
 from go2rtc_client.exceptions import handle_error
 
-from .messages import BaseMessage, ReceiveMessages, SendMessages, WebRTC, WsMessage
+from .messages import ReceiveMessages, SendMessages, WebRTC, WsMessage, _decode_message
 
 _LOGGER = logging.getLogger(__name__)
+# Exact type lookups are cheaper than isinstance against the union
+_RECEIVE_MESSAGE_TYPES: Final = frozenset(get_args(ReceiveMessages))
 
 
 class Go2RtcWsClient:
@@ -39,11 +41,13 @@ class Go2RtcWsClient:
             raise ValueError(msg)
 
         self._server_url = server_url
+        self._ws_url = urljoin(server_url, "/api/ws")
         self._session = session
         self._params = params
         self._client: ClientWebSocketResponse | None = None
         self._rx_task: asyncio.Task[None] | None = None
-        self._subscribers: list[Callable[[ReceiveMessages], None]] = []
+        # Tuple so the receive loop can iterate it without copying
+        self._subscribers: tuple[Callable[[ReceiveMessages], None], ...] = ()
         self._connect_lock = asyncio.Lock()
 
     @property
@@ -60,7 +64,7 @@ class Go2RtcWsClient:
 
             _LOGGER.debug("Trying to connect to %s", self._server_url)
             self._client = await self._session.ws_connect(
-                urljoin(self._server_url, "/api/ws"), params=self._params
+                self._ws_url, params=self._params
             )
 
             self._rx_task = asyncio.create_task(self._receive_messages())
@@ -93,46 +97,47 @@ class Go2RtcWsClient:
 
         await self._client.send_str(message.to_json())
 
-    def _process_text_message(self, data: Any) -> None:
+    def _process_text_message(self, msg: WSMessage) -> None:
         """Process text message."""
+        data = msg.data
         try:
-            message: WsMessage = BaseMessage.from_json(data)
+            message: WsMessage = _decode_message(data)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Invalid message received: %s", data)
         else:
-            if isinstance(message, WebRTC):
+            if type(message) is WebRTC:
                 message = message.value
-            if not isinstance(message, ReceiveMessages):
+            if type(message) not in _RECEIVE_MESSAGE_TYPES:
                 _LOGGER.error("Received unexpected message: %s", message)
                 return
+            if TYPE_CHECKING:
+                assert isinstance(message, ReceiveMessages)
             for subscriber in self._subscribers:
                 try:
                     subscriber(message)
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("Error on subscriber callback")
 
+    def _process_error_message(self, msg: WSMessage) -> None:
+        """Process error message."""
+        _LOGGER.error("Error received: %s", msg.data)
+
+    def _process_unknown_message(self, msg: WSMessage) -> None:
+        """Process unknown message."""
+        _LOGGER.warning("Received unknown message: %s", msg)
+
     async def _receive_messages(self) -> None:
         """Receive messages."""
         if TYPE_CHECKING:
             assert self._client
 
-        while self.connected:
-            msg = await self._client.receive()
-            match msg.type:
-                case (
-                    WSMsgType.CLOSE
-                    | WSMsgType.CLOSED
-                    | WSMsgType.CLOSING
-                    | WSMsgType.PING
-                    | WSMsgType.PONG
-                ):
-                    break
-                case WSMsgType.ERROR:
-                    _LOGGER.error("Error received: %s", msg.data)
-                case WSMsgType.TEXT:
-                    self._process_text_message(msg.data)
-                case _:
-                    _LOGGER.warning("Received unknown message: %s", msg)
+        handlers: dict[WSMsgType, Callable[[WSMessage], None]] = {
+            WSMsgType.TEXT: self._process_text_message,
+            WSMsgType.ERROR: self._process_error_message,
+        }
+        # Iteration stops when the connection is closed
+        async for msg in self._client:
+            handlers.get(msg.type, self._process_unknown_message)(msg)
 
     def subscribe(
         self, callback: Callable[[ReceiveMessages], None]
@@ -140,7 +145,11 @@ class Go2RtcWsClient:
         """Subscribe to messages."""
 
         def _unsubscribe() -> None:
-            self._subscribers.remove(callback)
+            self._subscribers = tuple(
+                subscriber
+                for subscriber in self._subscribers
+                if subscriber is not callback
+            )
 
-        self._subscribers.append(callback)
+        self._subscribers = (*self._subscribers, callback)
         return _unsubscribe
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Annotated, Any, ClassVar
+from dataclasses import dataclass, field, fields, replace
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Final, Self
 
 from mashumaro import field_options
 from mashumaro.config import BaseConfig
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 from mashumaro.types import Discriminator
+import orjson
 from webrtc_models import (
     RTCIceServer,  # noqa: TCH002 # Mashumaro needs the import to generate the correct code
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WsMessage:
     """Websocket message."""
 
@@ -27,10 +28,32 @@ class WsMessage:
         return d
 
 
-@dataclass(frozen=True)
-class BaseMessage(WsMessage, DataClassORJSONMixin):
+class _JsonCache:
+    """Slot for the cached encoded message.
+
+    A plain slot instead of a dataclass field, so it is not part of fields().
+    """
+
+    __slots__ = ("_json",)
+    if TYPE_CHECKING:
+        # Only for type checkers, mashumaro would serialize an annotated slot
+        _json: str
+
+
+def _create[_T: WsMessage](cls: type[_T], **values: Any) -> _T:
+    """Create a message without calling __init__ and __post_init__."""
+    obj = object.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+    return obj
+
+
+@dataclass(frozen=True, slots=True)
+class BaseMessage(WsMessage, _JsonCache, DataClassORJSONMixin):
     """Base message class."""
 
+    _FIELD_ALIASES: ClassVar[tuple[tuple[str, str], ...]]
+
     class Config(BaseConfig):
         """Config for BaseMessage."""
 
@@ -41,8 +64,57 @@ class BaseMessage(WsMessage, DataClassORJSONMixin):
             variant_tagger_fn=lambda cls: cls.TYPE,
         )
 
+    @classmethod
+    def _field_aliases(cls) -> tuple[tuple[str, str], ...]:
+        """Return the (field name, serialized name) pairs.
+
+        The fields are only known after the dataclass decorator ran,
+        therefore they are collected on first use instead of in __init_subclass__.
+        """
+        if (aliases := cls.__dict__.get("_FIELD_ALIASES")) is None:
+            aliases = tuple(
+                (f.name, f.metadata.get("alias", f.name)) for f in fields(cls)
+            )
+            cls._FIELD_ALIASES = aliases
+        return aliases
+
+    @classmethod
+    def _from_payload(cls, payload: dict[str, Any]) -> Self:
+        """Create from a decoded payload without going through mashumaro.
+
+        Only string values are taken as is, anything else is left to mashumaro
+        for the coercion and the errors.
+        """
+        values = {}
+        for name, alias in cls._field_aliases():
+            if type(value := payload.get(alias)) is not str:
+                return cls.from_dict(payload)
+            values[name] = value
+        return _create(cls, **values)
+
+    def _to_dict(self) -> dict[str, Any]:
+        """Convert to dict without going through mashumaro."""
+        d = {alias: getattr(self, name) for name, alias in self._field_aliases()}
+        d["type"] = self.TYPE
+        return d
+
+    def to_json(self, *args: Any, **kwargs: Any) -> str:
+        """Convert to json.
 
-@dataclass(frozen=True)
+        Messages are frozen, so the encoded form is cached on first use.
+        """
+        if args or kwargs:
+            # super() does not work in slotted dataclasses
+            return DataClassORJSONMixin.to_json(self, *args, **kwargs)
+        try:
+            return self._json
+        except AttributeError:
+            json = orjson.dumps(self._to_dict()).decode()
+            object.__setattr__(self, "_json", json)
+            return json
+
+
+@dataclass(frozen=True, slots=True)
 class WebRTCCandidate(BaseMessage):
     """WebRTC ICE candidate message."""
 
@@ -50,7 +122,7 @@ class WebRTCCandidate(BaseMessage):
     candidate: str = field(metadata=field_options(alias="value"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebRTC(BaseMessage):
     """WebRTC message."""
 
@@ -64,45 +136,80 @@ class WebRTC(BaseMessage):
         ),
     ]
 
+    @classmethod
+    def _from_payload(cls, payload: dict[str, Any]) -> Self:
+        """Create from a decoded payload."""
+        value = payload.get("value")
+        if (
+            type(value) is not dict
+            or value.get("type") != WebRTCAnswer.TYPE
+            or type(sdp := value.get("sdp")) is not str
+        ):
+            # Offers have nested ice servers, leave them and invalid values
+            # to mashumaro
+            return cls.from_dict(payload)
+        return _create(cls, value=_create(WebRTCAnswer, sdp=sdp))
+
+    def to_json(self, *args: Any, **kwargs: Any) -> str:
+        """Convert to json."""
+        # Not cached, the value can be an offer with mutable ice servers
+        return DataClassORJSONMixin.to_json(self, *args, **kwargs)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebRTCValue(WsMessage):
     """WebRTC value for WebRTC message."""
 
     sdp: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebRTCOffer(WebRTCValue):
     """WebRTC offer message."""
 
     TYPE = "offer"
     ice_servers: list[RTCIceServer]
 
-    def __pre_serialize__(self) -> WebRTCOffer:
-        """Pre serialize.
+    def __post_init__(self) -> None:
+        """Post init.
 
         Go2rtc supports only ice_servers with urls as list of strings.
+        The servers are copied, so the caller's instances are not modified.
         """
-        for server in self.ice_servers:
-            if isinstance(server.urls, str):
-                server.urls = [server.urls]
+        object.__setattr__(
+            self,
+            "ice_servers",
+            [
+                replace(server, urls=[server.urls])
+                if isinstance(server.urls, str)
+                else server
+                for server in self.ice_servers
+            ],
+        )
 
-        return self
+    def to_json(self, *args: Any, **kwargs: Any) -> str:
+        """Convert to json wrapped in a WebRTC message.
 
-    def to_json(self, **kwargs: Any) -> str:
-        """Convert to json."""
-        return WebRTC(self).to_json(**kwargs)
+        Not cached, as the ice servers can be modified after creation.
+        """
+        if args or kwargs:
+            return WebRTC(self).to_json(*args, **kwargs)
+        value = {
+            "sdp": self.sdp,
+            "ice_servers": [server.to_dict() for server in self.ice_servers],
+            "type": self.TYPE,
+        }
+        return orjson.dumps({"value": value, "type": WebRTC.TYPE}).decode()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebRTCAnswer(WebRTCValue):
     """WebRTC answer message."""
 
     TYPE = "answer"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WsError(BaseMessage):
     """Error message."""
 
@@ -110,5 +217,23 @@ class WsError(BaseMessage):
     error: str = field(metadata=field_options(alias="value"))
 
 
+_MESSAGE_TYPES: Final[dict[str, type[BaseMessage]]] = {
+    cls.TYPE: cls for cls in (WebRTCCandidate, WebRTC, WsError)
+}
+
+
+def _decode_message(data: str | bytes) -> BaseMessage:
+    """Decode a received message.
+
+    Known message types skip the mashumaro discriminator lookup.
+    """
+    payload = orjson.loads(data)
+    if type(payload) is not dict or type(type_ := payload.get("type")) is not str:
+        return BaseMessage.from_dict(payload)
+    if (cls := _MESSAGE_TYPES.get(type_)) is None:
+        return BaseMessage.from_dict(payload)
+    return cls._from_payload(payload)
+
+
 ReceiveMessages = WebRTCAnswer | WebRTCCandidate | WsError
 SendMessages = WebRTCCandidate | WebRTCOffer
@@ -1,10 +1,15 @@
 """Asynchronous Python client for go2rtc."""
 
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def load_fixture(filename: str) -> str:
-    """Load a fixture."""
+    """Load a fixture.
+
+    Fixtures are read only once per test run.
+    """
     path = Path(__package__) / "fixtures" / filename
     return path.read_text(encoding="utf-8")
 
@@ -1,10 +1,12 @@
 """Asynchronous Python client for go2rtc."""
 
 from collections.abc import AsyncGenerator, Generator
+from typing import Any, cast
 
 import aiohttp
 from aioresponses import aioresponses
 import pytest
+import pytest_asyncio
 from syrupy import SnapshotAssertion
 
 from go2rtc_client import Go2RtcRestClient
@@ -13,15 +15,57 @@ from . import URL
 from .syrupy import Go2RtcSnapshotExtension
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the go2rtc test options."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip snapshot assertions, for quick local runs only.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Configure pytest."""
+    if config.getoption("fast"):
+        if config.getoption("update_snapshots"):
+            # All snapshots look unused with --fast and would be deleted
+            msg = "--fast cannot be combined with --snapshot-update"
+            raise pytest.UsageError(msg)
+        # The skipped snapshots would otherwise fail the session as unused
+        config.option.warn_unused_snapshots = True
+
+
+class _NoSnapshot:
+    """Snapshot assertion matching anything."""
+
+    def __eq__(self, other: object) -> bool:
+        return True
+
+    def __hash__(self) -> int:
+        return 0
+
+    def __call__(self, **_: Any) -> "_NoSnapshot":
+        return self
+
+
 @pytest.fixture(name="snapshot")
-def snapshot_assertion(snapshot: SnapshotAssertion) -> SnapshotAssertion:
+def snapshot_assertion(
+    request: pytest.FixtureRequest, snapshot: SnapshotAssertion
+) -> SnapshotAssertion:
     """Return snapshot assertion fixture with the go2rtc extension."""
+    if request.config.getoption("fast"):
+        return cast(SnapshotAssertion, _NoSnapshot())
     return snapshot.use_extension(Go2RtcSnapshotExtension)
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def rest_client() -> AsyncGenerator[Go2RtcRestClient, None]:
-    """Return a go2rtc rest client."""
+    """Return a go2rtc rest client.
+
+    The client and its session are shared by all tests,
+    only the mocked responses are reset per test.
+    """
     async with (
         aiohttp.ClientSession() as session,
     ):
@@ -32,8 +76,24 @@ async def rest_client() -> AsyncGenerator[Go2RtcRestClient, None]:
         yield client_
 
 
+@pytest.fixture(scope="module")
+def _aioresponses() -> Generator[aioresponses, None, None]:
+    """Patch aiohttp once per module.
+
+    Not per session, the websocket tests need the real aiohttp client.
+    """
+    mocked_responses = aioresponses()
+    mocked_responses.start()
+    yield mocked_responses
+    mocked_responses.stop()
+
+
 @pytest.fixture(name="responses")
-def aioresponses_fixture() -> Generator[aioresponses, None, None]:
+def aioresponses_fixture(
+    _aioresponses: aioresponses,
+) -> Generator[aioresponses, None, None]:
     """Return aioresponses fixture."""
-    with aioresponses() as mocked_responses:
-        yield mocked_responses
+    yield _aioresponses
+    _aioresponses.clear()
+    # clear() keeps the recorded requests, which the call assertions count
+    _aioresponses.requests.clear()
@@ -0,0 +1,31 @@
+"""Tests for the go2rtc pytest options."""
+
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+
+from .conftest import pytest_configure
+
+
+def _config(**options: bool) -> pytest.Config:
+    """Return a minimal config with the given options."""
+    return cast(
+        pytest.Config,
+        SimpleNamespace(option=SimpleNamespace(**options), getoption=options.get),
+    )
+
+
+def test_fast_warns_unused_snapshots() -> None:
+    """Test --fast only warns about the skipped snapshots."""
+    config = _config(fast=True, update_snapshots=False, warn_unused_snapshots=False)
+    pytest_configure(config)
+    assert config.option.warn_unused_snapshots
+
+
+def test_fast_with_snapshot_update() -> None:
+    """Test --fast refuses --snapshot-update, which would delete all snapshots."""
+    config = _config(fast=True, update_snapshots=True, warn_unused_snapshots=False)
+    with pytest.raises(pytest.UsageError, match="--snapshot-update"):
+        pytest_configure(config)
+    assert not config.option.warn_unused_snapshots
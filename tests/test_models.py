@@ -0,0 +1,29 @@
+"""Tests for the go2rtc models."""
+
+from typing import Any
+
+import orjson
+import pytest
+
+from go2rtc_client.models import Streams, WebRTCSdpOffer, _decode_streams
+
+
+def test_webrtc_sdp_offer_to_json() -> None:
+    """Test the serialized offer matches the mashumaro output."""
+    offer = WebRTCSdpOffer("v=0...")
+    assert offer.to_json() == '{"type":"offer","sdp":"v=0..."}'
+    assert offer.to_json(orjson_options=orjson.OPT_INDENT_2) == (
+        '{\n  "type": "offer",\n  "sdp": "v=0..."\n}'
+    )
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [{"producers": None}, {}],
+    ids=["null", "missing"],
+)
+def test_streams_from_dict_without_producers(stream: dict[str, Any]) -> None:
+    """Test null or missing producers are decoded as an empty list."""
+    streams = Streams.from_dict({"streams": {"camera": stream}})
+    assert streams.streams["camera"].producers == []
+    assert _decode_streams({"camera": stream})["camera"].producers == []
@@ -0,0 +1,31 @@
+"""Tests for the go2rtc rest client against a real aiohttp server."""
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from go2rtc_client import Go2RtcRestClient
+from go2rtc_client.exceptions import Go2RtcClientError
+
+# Larger than the read buffer of a connection, so it is not received at once
+_LARGE_BODY = b"<html>" + b"x" * 4 * 1024 * 1024 + b"</html>"
+
+
+async def test_non_json_response_releases_connection() -> None:
+    """Test a large non JSON response is read, so the connection is released."""
+
+    async def handler(_: web.Request) -> web.Response:
+        return web.Response(body=_LARGE_BODY, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/api/streams", handler)
+    async with TestServer(app) as server, ClientSession() as session:
+        client = Go2RtcRestClient(session, str(server.make_url("/")))
+        with pytest.raises(Go2RtcClientError):
+            await client.streams.list()
+
+        connector = session.connector
+        assert connector is not None
+        # pylint: disable=protected-access
+        assert not connector._acquired
+        assert sum(len(conns) for conns in connector._conns.values()) == 1
@@ -1,8 +1,15 @@
 """Tests for the Go2RtcWsClient class."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Coroutine
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Generator,
+)
 import logging
+from typing import Any
 from unittest.mock import AsyncMock
 
 from aiohttp import (
@@ -30,6 +37,9 @@ from go2rtc_client.ws import (
     WebRTCOffer,
 )
 
+CANDIDATE = WebRTCCandidate("test")
+CANDIDATE_JSON = '{"value":"test","type":"webrtc/candidate"}'
+
 
 class TestServer:
     """Test server."""
@@ -70,6 +80,24 @@ class TestServer:
         await self.server.close()
 
 
+class FakeWS:
+    """Fake websocket connection yielding the given messages."""
+
+    def __init__(self, *messages: WSMessage) -> None:
+        """Initialize the fake connection."""
+        self._messages = messages
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[WSMessage]:
+        """Yield the messages."""
+        for message in self._messages:
+            yield message
+
+    async def close(self) -> None:
+        """Close the fake connection."""
+        self.closed = True
+
+
 @pytest.fixture
 async def server() -> AsyncGenerator[TestServer, None]:
     """Fixture to create a WebSocket test server."""
@@ -93,6 +121,27 @@ async def ws_client(
         await client.close()
 
 
+@pytest.fixture
+def logged() -> Generator[asyncio.Event, None, None]:
+    """Return an event set once the websocket client logged a record."""
+
+    class EventHandler(logging.Handler):
+        """Set the event on any record."""
+
+        def __init__(self) -> None:
+            super().__init__(logging.WARNING)
+            self.event = asyncio.Event()
+
+        def emit(self, record: logging.LogRecord) -> None:  # noqa: ARG002
+            self.event.set()
+
+    handler = EventHandler()
+    logger = logging.getLogger("go2rtc_client.ws.client")
+    logger.addHandler(handler)
+    yield handler.event
+    logger.removeHandler(handler)
+
+
 @pytest.fixture
 async def ws_client_connected(ws_client: Go2RtcWsClient) -> Go2RtcWsClient:
     """Fixture to connect client."""
@@ -123,7 +172,7 @@ async def test_connect_parallel(server: TestServer) -> None:
 @pytest.mark.parametrize(
     ("message", "expected"),
     [
-        (WebRTCCandidate("test"), '{"value":"test","type":"webrtc/candidate"}'),
+        (CANDIDATE, CANDIDATE_JSON),
         (
             WebRTCOffer("test", []),
             '{"value":{"sdp":"test","ice_servers":[],"type":"offer"},"type":"webrtc"}',
@@ -142,23 +191,21 @@ async def test_send(
     ws_client: Go2RtcWsClient, server: TestServer, message: SendMessages, expected: str
 ) -> None:
     """Test sending a message through the WebSocket."""
-    received_message = None
+    received_message: asyncio.Future[str] = asyncio.get_running_loop().create_future()
 
     def on_message(msg: WSMessage) -> None:
-        nonlocal received_message
-        received_message = msg.data
+        received_message.set_result(msg.data)
 
     server.on_message = on_message
 
     await ws_client.send(message)
-    await asyncio.sleep(0.1)
-    assert received_message == expected
+    assert await asyncio.wait_for(received_message, timeout=1) == expected
 
 
 @pytest.mark.parametrize(
     ("message", "expected"),
     [
-        ('{"value":"test","type":"webrtc/candidate"}', WebRTCCandidate("test")),
+        (CANDIDATE_JSON, CANDIDATE),
         (
             '{"value":{"type":"answer", "sdp":"test"},"type":"webrtc"}',
             WebRTCAnswer("test"),
@@ -172,18 +219,14 @@ async def test_receive(
     expected: ReceiveMessages,
 ) -> None:
     """Test receiving a message through the WebSocket."""
-    received_message = None
-
-    def on_message(message: ReceiveMessages) -> None:
-        nonlocal received_message
-        received_message = message
-
-    ws_client_connected.subscribe(on_message)
+    received_message: asyncio.Future[ReceiveMessages] = (
+        asyncio.get_running_loop().create_future()
+    )
+    ws_client_connected.subscribe(received_message.set_result)
 
     await server.send_message(message)
-    await asyncio.sleep(0.1)
 
-    assert received_message == expected
+    assert await asyncio.wait_for(received_message, timeout=1) == expected
 
 
 async def test_close(ws_client_connected: Go2RtcWsClient) -> None:
@@ -242,11 +285,12 @@ async def test_error_on_connect(
 async def test_receive_invalid_message(
     caplog: pytest.LogCaptureFixture,
     server: TestServer,
+    logged: asyncio.Event,
 ) -> None:
     """Test receiving an invalid message from the WebSocket server."""
     # Simulate receiving an invalid message
     await server.send_message("invalid json")
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(logged.wait(), timeout=1)
 
     assert caplog.record_tuples == [
         (
@@ -260,18 +304,18 @@ async def test_receive_invalid_message(
 async def test_subscribe_unsubscribe(ws_client: Go2RtcWsClient) -> None:
     """Test subscribe and unsubscribe functionality."""
     # pylint: disable=protected-access
-    assert ws_client._subscribers == []
+    assert ws_client._subscribers == ()
 
     def on_message(_: ReceiveMessages) -> None:
         pass
 
     unsub = ws_client.subscribe(on_message)
 
-    assert ws_client._subscribers == [on_message]
+    assert ws_client._subscribers == (on_message,)
 
     unsub()
 
-    assert ws_client._subscribers == []
+    assert ws_client._subscribers == ()
 
 
 async def test_subscriber_raised(
@@ -286,19 +330,14 @@ async def test_subscriber_raised(
 
     ws_client_connected.subscribe(on_message_raise)
 
-    received_message = None
-
-    def on_message(message: ReceiveMessages) -> None:
-        nonlocal received_message
-        received_message = message
+    received_message: asyncio.Future[ReceiveMessages] = (
+        asyncio.get_running_loop().create_future()
+    )
+    ws_client_connected.subscribe(received_message.set_result)
 
-    ws_client_connected.subscribe(on_message)
+    await server.send_message(CANDIDATE_JSON)
 
-    message = WebRTCCandidate("test")
-    await server.send_message(message.to_json())
-    await asyncio.sleep(0.1)
-
-    assert received_message == message
+    assert await asyncio.wait_for(received_message, timeout=1) == CANDIDATE
     assert caplog.record_tuples == [
         (
             "go2rtc_client.ws.client",
@@ -343,23 +382,18 @@ async def test_subscriber_raised(
 async def test_unexpected_messages(
     caplog: pytest.LogCaptureFixture,
     ws_client: Go2RtcWsClient,
+    logged: asyncio.Event,
     message: WSMessage,
     record: tuple[str, int, str],
 ) -> None:
     """Test unexpected messages."""
-    client = AsyncMock()
-    client.return_value.closed = False
-    ws_client._session.ws_connect = client  # type: ignore[method-assign] # pylint: disable=protected-access
-
-    async def receive() -> WSMessage:
-        nonlocal client
-        client.return_value.closed = True
 
-        return message
+    async def ws_connect(*_: Any, **__: Any) -> FakeWS:
+        return FakeWS(message)
 
-    client.return_value.receive.side_effect = receive
+    ws_client._session.ws_connect = ws_connect  # type: ignore[method-assign,assignment] # pylint: disable=protected-access
 
     await ws_client.connect()
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(logged.wait(), timeout=1)
 
     assert caplog.record_tuples == [record]
@@ -0,0 +1,112 @@
+"""Tests for the go2rtc websocket messages."""
+
+from dataclasses import asdict
+
+from mashumaro.exceptions import (
+    InvalidFieldValue,
+    MissingDiscriminatorError,
+    MissingField,
+    SuitableVariantNotFoundError,
+)
+import orjson
+import pytest
+from webrtc_models import RTCIceServer
+
+from go2rtc_client.ws import WebRTCCandidate, WebRTCOffer, WsError
+from go2rtc_client.ws.messages import BaseMessage, WebRTC, _decode_message
+
+
+def test_candidate_to_json_with_options() -> None:
+    """Test options are forwarded to mashumaro."""
+    candidate = WebRTCCandidate("test")
+    assert candidate.to_json(orjson_options=orjson.OPT_SORT_KEYS) == (
+        '{"type":"webrtc/candidate","value":"test"}'
+    )
+
+
+def test_to_json_cached() -> None:
+    """Test the encoded message is cached and not a dataclass field."""
+    candidate = WebRTCCandidate("test")
+    json = candidate.to_json()
+    assert candidate.to_json() is json
+    assert candidate.to_dict() == {"value": "test", "type": "webrtc/candidate"}
+    assert asdict(candidate) == {"candidate": "test"}
+    assert candidate == WebRTCCandidate("test")
+
+
+@pytest.mark.parametrize(
+    "message",
+    [WebRTCCandidate("test"), WsError("test")],
+)
+def test_to_json_matches_mashumaro(message: BaseMessage) -> None:
+    """Test the hand-rolled encoding matches the mashumaro one."""
+    assert orjson.loads(message.to_json()) == message.to_dict()
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        WebRTCOffer("test", []),
+        WebRTCOffer("test", [RTCIceServer("url", "user", "pass")]),
+        WebRTCOffer("test", [RTCIceServer(["url1", "url2"])]),
+    ],
+)
+def test_offer_to_json(message: WebRTCOffer) -> None:
+    """Test the offer is encoded like the wrapping WebRTC message."""
+    expected = WebRTC(message).to_dict()
+    assert orjson.loads(message.to_json()) == expected
+    assert orjson.loads(message.to_json(orjson_options=orjson.OPT_INDENT_2)) == expected
+
+
+def test_offer_normalizes_ice_server_urls() -> None:
+    """Test urls are wrapped in a list without touching the given server."""
+    server = RTCIceServer("url")
+    offer = WebRTCOffer("test", [server])
+    assert offer.ice_servers == [RTCIceServer(["url"])]
+    assert server.urls == "url"
+
+
+def test_offer_to_json_not_cached() -> None:
+    """Test changes to the ice servers are reflected in the encoded offer."""
+    offer = WebRTCOffer("test", [])
+    offer.to_json()
+    offer.ice_servers.append(RTCIceServer(["url"]))
+    assert orjson.loads(offer.to_json())["value"]["ice_servers"] == [{"urls": ["url"]}]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        '{"value":"test","type":"webrtc/candidate"}',
+        '{"value":"test","type":"error"}',
+        '{"value":{"type":"answer","sdp":"test"},"type":"webrtc"}',
+        '{"value":{"sdp":"test","ice_servers":[],"type":"offer"},"type":"webrtc"}',
+        '{"value":5,"type":"webrtc/candidate"}',
+        '{"value":null,"type":"error"}',
+        '{"value":{"type":"answer","sdp":5},"type":"webrtc"}',
+    ],
+)
+def test_decode_message(data: str) -> None:
+    """Test the fast decoder matches the mashumaro one."""
+    message = _decode_message(data)
+    expected = BaseMessage.from_json(data)
+    assert type(message) is type(expected)
+    assert message == expected
+    assert message.to_json() == expected.to_json()
+
+
+@pytest.mark.parametrize(
+    ("data", "exception"),
+    [
+        ('{"value":"test","type":"unknown"}', SuitableVariantNotFoundError),
+        ('{"value":"test"}', MissingDiscriminatorError),
+        ('{"type":"webrtc/candidate"}', MissingField),
+        ('{"type":"webrtc"}', MissingField),
+        ('{"value":"test","type":"webrtc"}', InvalidFieldValue),
+        ('{"value":{"type":"answer"},"type":"webrtc"}', InvalidFieldValue),
+    ],
+)
+def test_decode_message_invalid(data: str, exception: type[Exception]) -> None:
+    """Test decoding invalid messages raises."""
+    with pytest.raises(exception):
+        _decode_message(data)